@@ -1,4 +1,3 @@
-from .cli import Cli
 from .config import Config
 from .registry import (
     validate_arguments,
@@ -10,3 +9,13 @@ from .registry import (
 )
 
 __version__ = "0.7.4"
+
+
+def __getattr__(name):
+    # Lazily import the CLI (PEP 562) so that `import confit` does not pay
+    # for typer when only the config or registry machinery is needed
+    if name == "Cli":
+        from .cli import Cli
+
+        return Cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,4 @@
+import functools
 import inspect
 import sys
 from pathlib import Path
@@ -7,13 +8,45 @@ from typer import Context, Typer, colors, secho
 from typer.core import TyperCommand
 from typer.models import CommandFunctionType, Default
 
-from .config import Config, merge_from_disk
+from .config import Config, _needs_resolution, merge_from_disk
 from .errors import ConfitValidationError, LegacyValidationError, patch_errors
-from .registry import validate_arguments
+from .registry import PYDANTIC_V1, validate_arguments
 from .utils.random import set_seed
 from .utils.settings import is_debug
 from .utils.xjson import loads
 
+_DASH_TRANS = str.maketrans("-", "_")
+
+_rich_console = None
+_rich_checked = False
+
+
+def _get_rich_console():
+    """
+    Return a cached rich stderr console, or None if rich is not installed.
+    The import is only attempted once, on the first validation error.
+    """
+    global _rich_console, _rich_checked
+    if not _rich_checked:
+        _rich_checked = True
+        try:
+            from rich.console import Console
+
+            _rich_console = Console(stderr=True)
+        except ImportError:  # pragma: no cover
+            _rich_console = None
+    return _rich_console
+
+
+@functools.lru_cache(maxsize=None)
+def _get_validated(fn):
+    """
+    Build (or reuse) the validating wrapper of a command function.
+    Building it synthesizes a full pydantic model, so the result is cached
+    in case the same function is decorated again (tests, notebooks, ...).
+    """
+    return validate_arguments(fn)
+
 
 def parse_overrides(args: List[str]) -> Dict[str, Any]:
     """
@@ -30,25 +63,30 @@ def parse_overrides(args: List[str]) -> Dict[str, Any]:
     Dict[str, Any]
         The parsed overrides as a dictionary
     """
-    result = {}
-    while args:
-        opt = args.pop(0)
-        err = f"Invalid config override '{opt}'"
+    pairs = []
+    i = 0
+    n = len(args)
+    while i < n:
+        opt = args[i]
+        i += 1
         if opt.startswith("--"):  # new argument
-            opt = opt.replace("--", "")
-            if "=" in opt:  # we have --opt=value
-                opt, value = opt.split("=", 1)
-            else:
-                if not args or args[0].startswith("--"):  # flag with no value
+            opt = opt[2:]
+            opt, sep, value = opt.partition("=")
+            if not sep:  # no --opt=value, look for a separate value
+                if i >= n or args[i].startswith("--"):  # flag with no value
                     value = "true"
                 else:
-                    value = args.pop(0)
-            opt = opt.replace("-", "_")
-            result[opt] = loads(value)
+                    value = args[i]
+                    i += 1
+            opt = opt.translate(_DASH_TRANS)
+            pairs.append((opt, loads(value)))
         else:
-            secho(f"{err}: doesn't support shorthands", fg=colors.RED)
-            exit(1)
-    return result
+            secho(
+                f"Invalid config override '{opt}': doesn't support shorthands",
+                fg=colors.RED,
+            )
+            raise SystemExit(1)
+    return dict(pairs)
 
 
 class Cli(Typer):
@@ -77,7 +115,13 @@ class Cli(Typer):
         # Rich settings
         rich_help_panel: Union[str, None] = Default(None),
         registry: Any = None,
+        trusted: bool = False,
     ) -> Callable[[CommandFunctionType], CommandFunctionType]:
+        """
+        When `trusted` is True, the resolved config is passed directly to the
+        decorated function without pydantic validation or coercion. Only use
+        this for configs that are known to have the right types and shape.
+        """
         typer_command = super().command(
             name=name,
             cls=cls,
@@ -98,63 +142,79 @@ class Cli(Typer):
         )
 
         def wrapper(fn):
-            validated = validate_arguments(fn)
+            validated = _get_validated(fn)
+            model_fields = (
+                validated.model.__fields__
+                if PYDANTIC_V1
+                else validated.model.model_fields
+            )
+            model_field_names = frozenset(model_fields)
+            has_meta = _fn_has_meta(fn)
+            default_seed = model_fields.get("seed")
+            if default_seed is not None:
+                default_seed = default_seed.get_default()
 
             @typer_command
             def command(ctx: Context, config: Optional[List[Path]] = None):
                 config_path = config
 
-                has_meta = _fn_has_meta(fn)
                 if config_path:
                     config, name_from_file = merge_from_disk(config_path)
                 else:
                     config = Config({name: {}})
-                model_fields = (
-                    validated.model.model_fields
-                    if hasattr(validated.model, "model_fields")
-                    else validated.model.__fields__
-                )
+                # Cache the visited nodes so that overrides sharing a prefix
+                # (e.g. --a.b.x and --a.b.y) only walk the config tree once
+                nodes = {(): config}
                 for k, v in parse_overrides(ctx.args).items():
                     if "." not in k:
                         parts = (name, k)
                     else:
                         parts = k.split(".")
-                        if parts[0] in model_fields and parts[0] not in config:
+                        if parts[0] in model_field_names and parts[0] not in config:
                             parts = (name, *parts)
-                    current = config
-                    if parts[0] not in current:
+                    if parts[0] not in config:
                         raise Exception(
                             f"{k} does not match any existing section in config"
                         )
+                    current = config
+                    prefix = ()
                     for part in parts[:-1]:
-                        current = current.setdefault(part, Config())
+                        prefix = (*prefix, part)
+                        node = nodes.get(prefix)
+                        if node is None:
+                            node = nodes[prefix] = current.setdefault(part, Config())
+                        current = node
+                    # The assignment may replace a section: drop the cached
+                    # nodes at and under this path so later overrides do not
+                    # write into a detached node
+                    full = (*prefix, parts[-1])
+                    depth = len(full)
+                    nodes = {p: n for p, n in nodes.items() if p[:depth] != full}
                     current[parts[-1]] = v
                 try:
-                    default_seed = model_fields.get("seed")
-                    if default_seed is not None:
-                        default_seed = default_seed.get_default()
-                    seed = Config.resolve(
-                        config.get(name, {}).get("seed", default_seed),
-                        registry=registry,
-                        root=config,
-                    )
+                    seed = config.get(name, {}).get("seed", default_seed)
+                    if _needs_resolution(seed):
+                        seed = Config.resolve(seed, registry=registry, root=config)
                     if seed is not None:
                         set_seed(seed)
-                    resolved_config = Config(config[name]).resolve(
-                        registry=registry, root=config
-                    )
+                    resolved_config = Config.view(config[name])
+                    if _needs_resolution(resolved_config):
+                        resolved_config = resolved_config.resolve(
+                            registry=registry, root=config
+                        )
+                    caller = fn if trusted else validated
                     if has_meta:
                         config_meta = dict(
                             config_path=config_path,
                             resolved_config=resolved_config,
                             unresolved_config=config,
                         )
-                        return validated(
+                        return caller(
                             **resolved_config,
                             config_meta=config_meta,
                         )
                     else:
-                        return validated(**resolved_config)
+                        return caller(**resolved_config)
                 except (LegacyValidationError, ConfitValidationError) as e:
                     e.raw_errors = patch_errors(
                         e.raw_errors,
@@ -162,13 +222,11 @@ class Cli(Typer):
                     )
                     if is_debug() or e.__cause__ is not None:
                         raise e
-                    try:
-                        import rich
-
-                        console = rich.console.Console(stderr=True)
+                    console = _get_rich_console()
+                    if console is not None:
                         console.print("Validation error:", style="red", end=" ")
                         console.print(str(e))
-                    except ImportError:  # pragma: no cover
+                    else:  # pragma: no cover
                         print("Validation error:", file=sys.stderr, end=" ")
                         print(str(e), file=sys.stderr)
                     sys.exit(1)
@@ -180,5 +238,6 @@ class Cli(Typer):
         return wrapper
 
 
+@functools.lru_cache(maxsize=None)
 def _fn_has_meta(fn):
     return "config_meta" in inspect.signature(fn).parameters
@@ -1,8 +1,11 @@
 import collections.abc
 import keyword
+import os
 import re
+import threading
 from collections import UserDict
-from configparser import ConfigParser
+from configparser import RawConfigParser
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Tuple, TypeVar, Union
@@ -32,6 +35,114 @@ ID = r"[^\d\W]\w*"
 UNQUOTED_ID = rf"(?<![\'\"\w]){ID}(?![\'\"\w])"
 PATH_PART = rf"(?:'{ID}(?:[.]{ID})+'|\"{ID}(?:[.]{ID})+\"|{UNQUOTED_ID})"
 PATH = rf"{UNQUOTED_ID}(?:[.]{PATH_PART})*"
+# Group 1 is the config path, group 2 the optional ":"-introduced tail
+# that must be kept verbatim. Consuming the tail inside the match (and
+# ruling out colon-preceded starts with the lookbehind) removes the
+# Python-side post-filtering that each match used to need
+PATH_REF_RE = re.compile(rf"(?<!:)({PATH})(:(?:{PATH})?)?")
+
+# Container types checked in hot isinstance calls, hoisted to avoid
+# rebuilding the tuple per check
+CONTAINER_TYPES = (dict, list, tuple, collections.abc.Mapping)
+
+# Exact types serialized as-is; checking `type(o) in SIMPLE_TYPES` is a
+# single set probe, with isinstance kept as a fallback for subclasses
+SIMPLE_TYPES = frozenset((str, int, float, bool, type(None), Reference))
+
+
+def _needs_resolution(obj: Any) -> bool:
+    """
+    Check, with an iterative walk, whether an object contains anything that
+    `Config.resolve` would act on: a `Reference` or a `@factory`-style key.
+
+    Parameters
+    ----------
+    obj: Any
+
+    Returns
+    -------
+    bool
+    """
+    stack = [obj]
+    seen = set()
+    while stack:
+        o = stack.pop()
+        if isinstance(o, Reference):
+            return True
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        if isinstance(o, Mapping):
+            for k, v in o.items():
+                if isinstance(k, str) and k.startswith("@"):
+                    return True
+                stack.append(v)
+        elif isinstance(o, (list, tuple)):
+            stack.extend(o)
+    return False
+
+
+@lru_cache(maxsize=None)
+def _get_yaml_classes():
+    """
+    Import yaml and build the confit loader and dumper classes, once.
+    The classes used to be redefined (and their representer dicts rebuilt)
+    on every YAML (de)serialization call.
+    """
+    import yaml
+
+    # Use the libyaml-backed classes when available
+    base_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    base_dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+    class ConfitYamlLoader(base_loader):
+        def construct_object(self, x, deep=False):
+            if isinstance(x, yaml.ScalarNode):
+                if x.style == '"' or x.style == "'":
+                    return loads(x.style + x.value + x.style)
+                return loads(x.value)
+            return super().construct_object(x, deep)
+
+    class ConfitYamlDumper(base_dumper):
+        def represent_ref(self, node):
+            return super().represent_scalar("tag:yaml.org,2002:str", str(node))
+
+        def represent_str(self, data):
+            node = super().represent_scalar("tag:yaml.org,2002:str", data)
+            if set(",'\"{}[]$\n\t") & set(data):
+                node.style = "'" if data.count('"') > data.count("'") else '"'
+            return node
+
+        yaml_representers = {
+            **base_dumper.yaml_representers,
+            Config: base_dumper.represent_dict,
+            Reference: represent_ref,
+            str: represent_str,
+        }
+
+    return ConfitYamlLoader, ConfitYamlDumper
+
+
+_PARSER_LOCAL = threading.local()
+
+
+def _get_cfg_parser() -> RawConfigParser:
+    """
+    Return a thread-local RawConfigParser, reset between uses, to avoid paying
+    for the parser's initialization on every `from_cfg_str` call. The raw
+    variant skips the interpolation dispatch entirely (confit has its own
+    `${...}` interpolation).
+    """
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = _PARSER_LOCAL.parser = RawConfigParser()
+        parser.optionxform = str
+    else:
+        # clear() drops the sections but keeps the [DEFAULT] entries, which
+        # would otherwise leak into every config parsed afterwards
+        parser.clear()
+        parser[parser.default_section].clear()
+    return parser
 
 
 class DynamicLocals(UserDict):
@@ -80,7 +191,25 @@ class Config(dict):
         if len(args) == 1 and isinstance(args[0], dict):
             assert len(kwargs) == 0
             kwargs = args[0]
-        super().__init__(**kwargs)
+        super().__init__(kwargs)
+
+    @classmethod
+    def view(cls, data: Mapping) -> "Config":
+        """
+        Wrap an existing mapping in a Config without the keyword-argument
+        round-trip of the constructor. The entries are shallow-copied.
+
+        Parameters
+        ----------
+        data: Mapping
+
+        Returns
+        -------
+        Config
+        """
+        obj = cls()
+        dict.update(obj, data)
+        return obj
 
     @classmethod
     def from_cfg_str(cls, s: str, resolve: bool = False, registry: Any = None) -> Any:
@@ -101,32 +230,68 @@ class Config(dict):
         -------
         Config
         """
-        parser = ConfigParser(interpolation=None)
-        parser.optionxform = str
+        parser = _get_cfg_parser()
         parser.read_string(s)
+        return cls._from_cfg_parser(parser, resolve=resolve, registry=registry)
 
+    @classmethod
+    def _from_cfg_parser(
+        cls, parser: RawConfigParser, resolve: bool = False, registry: Any = None
+    ) -> Any:
+        """
+        Build a config object from a filled cfg parser
+
+        Parameters
+        ----------
+        parser: RawConfigParser
+            The parser holding the sections to convert
+        resolve
+            Whether to resolve sections with '@' keys
+        registry
+            Optional registry to resolve from.
+            If None, the default registry will be used.
+
+        Returns
+        -------
+        Config
+        """
         config = Config()
 
+        # Section nodes indexed by path prefix, so that sibling sections
+        # sharing a prefix do not re-walk the tree from the root
+        node_cache = {(): config}
+
+        # Local bindings for the per-item loop below
+        _split_path = split_path
+        _loads = loads
+
         for section in parser.sections():
-            parts = split_path(section)
+            parts = _split_path(section)
             current = config
+            prefix = ()
             for part in parts:
-                if part not in current:
-                    current[part] = current = Config()
-                else:
-                    current = current[part]
-
-            current.clear()
+                prefix = (*prefix, part)
+                node = node_cache.get(prefix)
+                if node is None:
+                    node = node_cache[prefix] = current.setdefault(part, Config())
+                current = node
+
+            if current:
+                # The cleared node may have cached descendants: drop them
+                depth = len(parts)
+                node_cache = {
+                    p: n
+                    for p, n in node_cache.items()
+                    if len(p) <= depth or p[:depth] != parts
+                }
+                current.clear()
             errors = []
             for k, v in parser.items(section):
-                path = split_path(k)
+                path = _split_path(k)
                 for part in path[:-1]:
-                    if part not in current:
-                        current[part] = current = Config()
-                    else:
-                        current = current[part]
+                    current = current.setdefault(part, Config())
                 try:
-                    current[path[-1]] = loads(v)
+                    current[path[-1]] = _loads(v)
                 except ValueError as e:
                     errors.append(ErrorWrapper(e, loc=path))
 
@@ -142,16 +307,8 @@ class Config(dict):
     def from_yaml_str(cls, s: str, resolve: bool = False, registry: Any = None) -> Any:
         import yaml
 
-        class ConfitYamlLoader(yaml.SafeLoader):
-            def construct_object(self, x, deep=False):
-                if isinstance(x, yaml.ScalarNode):
-                    if x.style == '"' or x.style == "'":
-                        return loads(x.style + x.value + x.style)
-                    return loads(x.value)
-                return super().construct_object(x, deep)
-
-        stream = StringIO(s)
-        config = Config(yaml.load(stream, Loader=ConfitYamlLoader))
+        loader, _ = _get_yaml_classes()
+        config = Config(yaml.load(s, Loader=loader))
         if resolve:
             return config.resolve(registry=registry)
 
@@ -178,12 +335,23 @@ class Config(dict):
         -------
         Config
         """
-        s = Path(path).read_text(encoding="utf-8")
         path_str = str(path)
         if path_str.endswith(".yaml") or path_str.endswith(".yml"):
-            return cls.from_yaml_str(s, resolve=resolve, registry=registry)
+            import yaml
+
+            loader, _ = _get_yaml_classes()
+            with open(path, "r", encoding="utf-8") as f:
+                config = Config(yaml.load(f, Loader=loader))
+            if resolve:
+                return config.resolve(registry=registry)
+            return config
         else:
-            return cls.from_cfg_str(s, resolve=resolve, registry=registry)
+            # Stream the file into the parser line by line instead of
+            # materializing it as an intermediate string
+            parser = _get_cfg_parser()
+            with open(path, "r", encoding="utf-8") as f:
+                parser.read_file(f)
+            return cls._from_cfg_parser(parser, resolve=resolve, registry=registry)
 
     from_str = from_cfg_str
 
@@ -198,9 +366,12 @@ class Config(dict):
         path_str = str(path)
         if path_str.endswith(".yaml") or path_str.endswith(".yml"):
             s = self.to_yaml_str()
+            Path(path).write_text(s, encoding="utf-8")
         else:
-            s = Config.to_str(self)
-        Path(path).write_text(s, encoding="utf-8")
+            # Stream directly to the file, without materializing the
+            # whole config as an intermediate string
+            with open(path, "w", encoding="utf-8") as f:
+                Config._write_cfg(self, f)
 
     def serialize(self: Any):
         """
@@ -227,30 +398,41 @@ class Config(dict):
         # Temp memory to avoid objects being garbage collected
         mem = []
 
+        # Jsonable forms of leaf objects already encoded during this call.
+        # Scoped to the call: a cache shared between calls would return
+        # stale output once the object is mutated
+        jsonable_cache = {}
+
         def is_simple(o):
-            return o is None or isinstance(o, (str, int, float, bool, Reference))
+            return type(o) in SIMPLE_TYPES or isinstance(
+                o, (str, int, float, bool, Reference)
+            )
 
         def rec(o: Any, path: Loc = ()):
             if id(o) in refs:
                 return refs[id(o)]
             if is_simple(o):
                 return o
-            if isinstance(o, collections.abc.Mapping):
-                items = sorted(
-                    o.items(),
-                    key=lambda x: 1
-                    if (
-                        is_simple(x[1])
-                        or isinstance(x[1], (collections.abc.Mapping, list, tuple))
-                    )
-                    else 0,
-                )
-                serialized = {k: rec(v, (*path, k)) for k, v in items}
-                serialized = {k: serialized[k] for k in o.keys()}
+            if isinstance(o, dict) or isinstance(o, collections.abc.Mapping):
+                # Visit resolved leaf objects before scalars and containers so
+                # that later occurrences serialize as references to them; a
+                # stable two-bucket partition replaces the keyed sort
+                head, tail = [], []
+                for kv in o.items():
+                    v = kv[1]
+                    if is_simple(v) or isinstance(v, CONTAINER_TYPES):
+                        tail.append(kv)
+                    else:
+                        head.append(kv)
+                items = head + tail
+                tmp = {k: rec(v, (*path, k)) for k, v in items}
                 mem.append(o)
                 refs[id(o)] = Reference(join_path(path))
-                if isinstance(o, Config):
-                    serialized = Config(serialized)
+                # Restore the mapping's own key order, writing directly into
+                # the output container to skip the Config re-wrap
+                serialized = Config() if isinstance(o, Config) else {}
+                for k in o:
+                    serialized[k] = tmp[k]
                 return serialized
             if isinstance(o, (list, tuple)):
                 mem.append(o)
@@ -269,68 +451,67 @@ class Config(dict):
                 mem.append(o)
                 refs[id(o)] = Reference(join_path(path))
                 return rec(cfg, path)
+            if id(o) in jsonable_cache:
+                return jsonable_cache[id(o)]
             try:
-                return pydantic_core.to_jsonable_python(o)
+                res = pydantic_core.to_jsonable_python(o)
             except Exception:
                 raise TypeError(f"Cannot dump {o!r} at {join_path(path)}")
+            mem.append(o)
+            jsonable_cache[id(o)] = res
+            return res
 
         return rec(self)
 
-    def to_cfg_str(self):
+    def _write_cfg(self, stream):
         """
-        Export a config to a string in the cfg format
-        by serializing it first
+        Serialize the config and write it in the cfg format to a stream
 
-        Returns
-        -------
-        str
+        Parameters
+        ----------
+        stream: TextIO
         """
         additional_sections = {}
 
         prepared = flatten_sections(Config.serialize(self))
         prepared.update(flatten_sections(additional_sections))
 
-        parser = ConfigParser(interpolation=None)
-        parser.optionxform = str
+        # Emit the cfg lines directly: values produced by `dumps` never
+        # contain newlines, so the ConfigParser writer machinery is overhead
         for section_name, section in prepared.items():
-            parser.add_section(section_name)
-            parser[section_name].update(
-                {join_path((k,)): dumps(v) for k, v in section.items()}
-            )
+            stream.write(f"[{section_name}]\n")
+            for k, v in section.items():
+                stream.write(f"{join_path((k,))} = {dumps(v)}\n")
+            stream.write("\n")
+
+    def to_cfg_str(self):
+        """
+        Export a config to a string in the cfg format
+        by serializing it first
+
+        Returns
+        -------
+        str
+        """
         s = StringIO()
-        parser.write(s)
+        Config._write_cfg(self, s)
         return s.getvalue()
 
     def to_yaml_str(self):
         import yaml
 
-        class ConfitYamlDumper(yaml.SafeDumper):
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, **kwargs)
-
-            def represent_ref(self, node):
-                return super().represent_scalar("tag:yaml.org,2002:str", str(node))
-
-            def represent_str(self, data):
-                node = super().represent_scalar("tag:yaml.org,2002:str", data)
-                if set(",'\"{}[]$\n\t") & set(data):
-                    node.style = "'" if data.count('"') > data.count("'") else '"'
-                return node
-
-            yaml_representers = {
-                **yaml.SafeDumper.yaml_representers,
-                Config: yaml.SafeDumper.represent_dict,
-                Reference: represent_ref,
-                str: represent_str,
-            }
-
-        return yaml.dump(
-            self.serialize(), Dumper=ConfitYamlDumper, sort_keys=False, indent=4
-        )
+        _, dumper = _get_yaml_classes()
+        return yaml.dump(self.serialize(), Dumper=dumper, sort_keys=False, indent=4)
 
     to_str = to_cfg_str
 
-    def resolve(self, deep=True, registry: Any = None, root: Mapping = None) -> Any:
+    def resolve(
+        self,
+        deep=True,
+        registry: Any = None,
+        root: Mapping = None,
+        bypass_validators: bool = False,
+    ) -> Any:
         """
         Resolves the parts of the nested config object with @ variables using
         a registry, and then interpolate references in the config.
@@ -343,6 +524,10 @@ class Config(dict):
             Registry to use when resolving
         root: Mapping
             The root of the config tree. Used for resolving references.
+        bypass_validators: bool
+            Call the raw registered functions instead of their validating
+            wrappers. Only use this on configs that have already been
+            validated: values are passed through without coercion.
 
         Returns
         -------
@@ -351,65 +536,89 @@ class Config(dict):
         if root is None:
             root = self
 
+        # Nothing to resolve: skip the traversal entirely
+        if not _needs_resolution(self):
+            return self
+
         if registry is None:
             from .registry import get_default_registry
 
             registry = get_default_registry()
         resolved_locs = {}
         seen_locs = set()
+        # Parsed reference expressions, shared between identical references
+        ref_cache = {}
+        # Factory functions, shared between sections using the same
+        # (@key, name) pair during this resolve call
+        factory_cache = {}
 
         def resolve_reference(ref: Reference) -> Any:
-            pat = re.compile(PATH + ":?")
+            pat = PATH_REF_RE
 
             def replace(match: re.Match):
-                start = match.start()
-                if start > 0 and ref.value[start - 1] == ":":
-                    return match.group()
-
-                path = match.group()
-                parts = split_path(path.rstrip(":"))
+                path = match.group(1)
+                parts = split_path(path)
 
                 # Check if part is any special python keyword
                 if len(parts) == 1 and parts[0] in keyword.kwlist:
                     return match.group()
+                tail = match.group(2)
                 try:
-                    return local_names[parts] + ("." if path.endswith(":") else "")
+                    return local_names[parts] + ("." + tail[1:] if tail else "")
                 except KeyError:
                     raise KeyError(path)
 
-            local_names = {}
-            for match in pat.finditer(ref.value):
-                start = match.start()
-                if start > 0 and ref.value[start - 1] == ":":
-                    continue
-                path = match.group()
-                parts = split_path(path.rstrip(":"))
-                if len(parts) == 1 and parts[0] in keyword.kwlist:
-                    continue
-                local_names.setdefault(parts, f"var_{len(local_names)}")
+            cached = ref_cache.get(ref.value)
+            if cached is None:
+                local_names = {}
+                for match in pat.finditer(ref.value):
+                    parts = split_path(match.group(1))
+                    if len(parts) == 1 and parts[0] in keyword.kwlist:
+                        continue
+                    local_names.setdefault(parts, f"var_{len(local_names)}")
 
-            local_leaves = DynamicLocals(local_names, root, resolved_locs, rec)
+                replaced = pat.sub(replace, ref.value)
+                ref_cache[ref.value] = (local_names, replaced)
+            else:
+                local_names, replaced = cached
 
-            replaced = pat.sub(replace, ref.value)
+            # References without any config path (e.g. ${1+2}) don't need
+            # the dynamic locals machinery
+            if not local_names:
+                return safe_eval(replaced)
+
+            local_leaves = DynamicLocals(local_names, root, resolved_locs, rec)
 
             res = safe_eval(replaced, local_leaves)
 
             return res
 
-        def rec(obj, loc: Tuple[Union[str, int]] = ()):
+        # Current path in the tree, mutated around recursive calls to avoid
+        # allocating a new tuple per visited node
+        loc = []
+
+        def rec(obj, at: Tuple[Union[str, int]] = None):
             """
             Parameters
             ----------
             obj: Any
                 The current object being resolved
-            loc: Sequence[str]
-                Internal variable
-                Current path in tree
+            at: Sequence[str]
+                Optional absolute location to resolve the object at, used
+                when jumping to a referenced node
 
             Returns
             -------
 
             """
+            if at is not None:
+                saved = loc[:]
+                loc[:] = at
+                try:
+                    return rec(obj)
+                finally:
+                    loc[:] = saved
+
             if id(obj) in resolved_locs:
                 return resolved_locs[id(obj)]
 
@@ -421,14 +630,22 @@ class Config(dict):
             if not deep and len(loc) > 1:
                 return obj
 
-            if isinstance(obj, Mapping):
-                resolved = Config({k: rec(v, (*loc, k)) for k, v in obj.items()})
-
-                registries = [
-                    (key, value, getattr(registry, key[1:]))
-                    for key, value in resolved.items()
-                    if key.startswith("@")
-                ]
+            # Exact-type checks first: isinstance against the Mapping ABC
+            # goes through the subclasshook machinery, which is much slower
+            # than the identity tests covering virtually every node
+            t = type(obj)
+            if t is Config or t is dict or isinstance(obj, Mapping):
+                # Build the resolved mapping and collect the factory keys in
+                # a single pass instead of re-scanning the items afterwards
+                resolved = Config()
+                registries = []
+                for key, value in obj.items():
+                    loc.append(key)
+                    value = rec(value)
+                    loc.pop()
+                    resolved[key] = value
+                    if key.startswith("@"):
+                        registries.append((key, value, getattr(registry, key[1:])))
                 assert (
                     len(registries) <= 1
                 ), f"Cannot resolve using multiple registries at {'.'.join(loc)}"
@@ -437,7 +654,13 @@ class Config(dict):
                     cfg = resolved
                     params = dict(resolved)
                     params.pop(registries[0][0])
-                    fn = registries[0][2].get(registries[0][1])
+                    fn_key = (registries[0][0], registries[0][1])
+                    fn = factory_cache.get(fn_key)
+                    if fn is None:
+                        fn = registries[0][2].get(registries[0][1])
+                        if bypass_validators:
+                            fn = getattr(fn, "__wrapped__", fn)
+                        factory_cache[fn_key] = fn
                     try:
                         resolved = fn(**params)
                         # The `validate_arguments` decorator has most likely
@@ -447,7 +670,7 @@ class Config(dict):
                         Config._store_resolved(resolved, cfg)
                     except ConfitValidationError as e:
                         e = ConfitValidationError(
-                            errors=patch_errors(e.raw_errors, loc, params),
+                            errors=patch_errors(e.raw_errors, tuple(loc), params),
                             model=e.model,
                             name=getattr(e, "name", None),
                         ).with_traceback(remove_lib_from_traceback(e.__traceback__))
@@ -456,17 +679,19 @@ class Config(dict):
                             e.__suppress_context__ = True
                         raise e
 
-            elif isinstance(obj, list):
-                resolved = [rec(v, (*loc, i)) for i, v in enumerate(obj)]
-            elif isinstance(obj, tuple):
-                resolved = tuple(rec(v, (*loc, i)) for i, v in enumerate(obj))
-            elif isinstance(obj, Reference):
-                while True:
-                    try:
-                        resolved = resolve_reference(obj)
-                        break
-                    except (KeyError, NameError):
-                        raise MissingReference(obj)
+            elif t is list or t is tuple or isinstance(obj, (list, tuple)):
+                resolved = []
+                for i, v in enumerate(obj):
+                    loc.append(i)
+                    resolved.append(rec(v))
+                    loc.pop()
+                if isinstance(obj, tuple):
+                    resolved = tuple(resolved)
+            elif t is Reference or isinstance(obj, Reference):
+                try:
+                    resolved = resolve_reference(obj)
+                except (KeyError, NameError):
+                    raise MissingReference(obj)
             else:
                 resolved = obj
 
@@ -474,7 +699,7 @@ class Config(dict):
 
             return resolved
 
-        return rec(self, ())
+        return rec(self)
 
     def merge(
         self,
@@ -535,7 +760,14 @@ class Config(dict):
 
         config = self.copy()
         for u in updates:
-            rec(config, u)
+            # Flat updates (no dotted key, no nested section) reduce to a
+            # plain dict update, skipping the recursion entirely
+            if all("." not in k and not isinstance(v, dict) for k, v in u.items()):
+                if remove_extra:
+                    u = {k: v for k, v in u.items() if k in config}
+                config.update(u)
+            else:
+                rec(config, u)
         return config
 
     def copy(self: T) -> T:
@@ -551,27 +783,60 @@ class Config(dict):
         -------
         Any
         """
-        seen = {}
-
-        def rec(obj):
-            if id(obj) in seen:
-                return seen[id(obj)]
-            seen[id(obj)] = obj
+        # Iterative two-pass copy: allocate one shell per visited container,
+        # then fill the shells children-first. Shared nodes now all map to
+        # the same copy (the recursive version returned the original for
+        # nodes visited twice) and deep configs cannot hit the recursion
+        # limit.
+        copies = {}
+        order = []
+        tuples = []
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            if id(obj) in copies:
+                continue
             if isinstance(obj, (Config, dict)):
-                return type(obj)(
-                    {k: rec(v) for k, v in obj.items()},
-                )
+                copies[id(obj)] = type(obj)()
+                order.append(obj)
+                stack.extend(obj.values())
             elif isinstance(obj, list):
-                return [rec(v) for v in obj]
+                copies[id(obj)] = []
+                order.append(obj)
+                stack.extend(obj)
             elif isinstance(obj, tuple):
-                return tuple(rec(v) for v in obj)
+                # Placeholder, finalized below once the children's copies
+                # exist
+                copies[id(obj)] = None
+                tuples.append(obj)
+                stack.extend(obj)
             elif isinstance(obj, Reference):
-                return Reference(obj.value)
+                copies[id(obj)] = Reference(obj.value)
+
+        def build_tuple(o):
+            # Discovery order is not topological when a node is shared by
+            # several parents, so nested tuples are finalized recursively;
+            # dict and list children only need their shell to exist
+            made = copies[id(o)]
+            if made is None:
+                made = copies[id(o)] = tuple(
+                    build_tuple(v) if isinstance(v, tuple) else copies.get(id(v), v)
+                    for v in o
+                )
+            return made
+
+        for obj in tuples:
+            build_tuple(obj)
+
+        for obj in order:
+            if isinstance(obj, dict):
+                target = copies[id(obj)]
+                for k, v in obj.items():
+                    target[k] = copies.get(id(v), v)
             else:
-                return obj
+                copies[id(obj)].extend(copies.get(id(v), v) for v in obj)
 
-        copy = rec(self)
-        return copy
+        return copies.get(id(self), self)
 
     @classmethod
     def _store_resolved(cls, resolved: Any, config: Dict[str, Any]):
@@ -591,6 +856,15 @@ class Config(dict):
             pass
 
 
+@lru_cache(maxsize=32)
+def _from_disk_cached(path: str, mtime_ns: int, size: int) -> "Config":
+    """
+    Load a config file, memoized on the file's path, modification time and
+    size so that repeated invocations (tests, watch loops) skip re-parsing.
+    """
+    return Config.from_disk(path, resolve=False)
+
+
 def merge_from_disk(
     config_paths: Union[Path, List[Path]],
     returned_name: str = "first",
@@ -615,7 +889,13 @@ def merge_from_disk(
     if isinstance(config_paths, Path):
         config_paths = [config_paths]
 
-    configs = [Config.from_disk(p, resolve=False) for p in config_paths]
+    configs = []
+    for p in config_paths:
+        stat = os.stat(p)
+        # Copy so that callers can freely mutate the result without
+        # corrupting the cached config
+        cached = _from_disk_cached(str(p), stat.st_mtime_ns, stat.st_size)
+        configs.append(cached.copy())
     config_names = [p.stem for p in config_paths]
 
     name = config_names[0] if returned_name == "first" else "+".join(config_names)
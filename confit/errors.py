@@ -30,6 +30,18 @@ from confit.utils.xjson import Reference
 Loc = Tuple[Union[int, str]]
 PYDANTIC_V1 = pydantic.VERSION.split(".")[0] == "1"
 
+# Partially evaluate the pydantic version check once, instead of
+# re-branching on it for every descended path component
+if PYDANTIC_V1:
+
+    def _get_field_type(model, part):
+        return model.__fields__[part].type_
+
+else:
+
+    def _get_field_type(model, part):
+        return model.model_fields[part].annotation
+
 
 class MissingReference(Exception):
     """
@@ -75,9 +87,6 @@ class CyclicReferenceError(Exception):
         return "Cyclic reference detected at {}".format(join_path(self.path))
 
 
-PATCHED_ERRORS_CLS = {}
-
-
 def remove_lib_from_traceback(tb):
     """
     Remove the lib folder from the traceback
@@ -85,12 +94,19 @@ def remove_lib_from_traceback(tb):
     # compare package to module in f_globals
     if is_debug():
         return tb
-    if tb is not None and tb.tb_frame.f_globals.get("__package__") == __package__:
-        return remove_lib_from_traceback(tb.tb_next)
-    if tb is None or tb.tb_next is None:
-        return tb
-    tb.tb_next = remove_lib_from_traceback(tb.tb_next)
-    return tb
+    pkg = __package__
+    # Drop the leading confit frames, then rewire tb_next in place to skip
+    # the remaining ones, without one Python frame per traceback entry
+    while tb is not None and tb.tb_frame.f_globals.get("__package__") == pkg:
+        tb = tb.tb_next
+    head = tb
+    while tb is not None and tb.tb_next is not None:
+        nxt = tb.tb_next
+        if nxt.tb_frame.f_globals.get("__package__") == pkg:
+            tb.tb_next = nxt.tb_next
+        else:
+            tb = nxt
+    return head
 
 
 class ConfitValidationError(LegacyValidationError):
@@ -110,10 +126,10 @@ class ConfitValidationError(LegacyValidationError):
         no_errors = len(errors)
         err_list_str = "\n".join(
             "{loc_str}\n{msg}".format(
-                loc_str="-> " + ".".join(str(e) for e in err["loc"]),
+                loc_str="-> " + ".".join(map(str, err["loc"])),
                 msg=err["msg"],
             )
-            for err in self.errors()
+            for err in errors
         )
         name_str = (" for " + self.name + "()") if self.name is not None else ""
         return (
@@ -122,21 +138,28 @@ class ConfitValidationError(LegacyValidationError):
         )
 
     def errors(self) -> List:
+        # raw_errors never change once the exception is built, so the
+        # flattening and message formatting only need to run once
+        if self._error_cache is not None:
+            return self._error_cache
         error_dicts = []
+        _indent = indent
+        _get_exc_type = get_exc_type
         for err in flatten_errors(self.raw_errors):
             msg = (
-                err.exc.msg_template.format(**err.exc.__dict__)
+                err.exc.msg_template.format_map(err.exc.__dict__)
                 if hasattr(err.exc, "msg_template")
                 else str(err.exc)
             )
             error_dicts.append(
                 {
                     "loc": err.loc_tuple(),
-                    "msg": indent(msg, "   "),
+                    "msg": _indent(msg, "   "),
                     "ctx": err.exc.__dict__,
-                    "type": get_exc_type(err.exc.__class__),
+                    "type": _get_exc_type(err.exc.__class__),
                 }
             )
+        self._error_cache = error_dicts
         return error_dicts
 
     def __repr_args__(self):
@@ -192,6 +215,30 @@ def to_legacy_error(err: pydantic.ValidationError, model: Any) -> LegacyValidati
 T = TypeVar("T")
 
 
+def _make_patched_error_cls(cls):
+    """
+    Build a subclass of an error class whose rendered message also reports
+    the actual value and type that triggered the error.
+    """
+    if hasattr(cls, "msg_template"):
+        return type(
+            cls.__name__,
+            (cls,),
+            {"msg_template": cls.msg_template + ", got {actual_value} ({actual_type})"},
+        )
+
+    def error_str(self):
+        s = cls.__str__(self)
+        s = (
+            s + f", got {self.actual_value} ({self.actual_type})"
+            if hasattr(self, "actual_value")
+            else s
+        )
+        return s
+
+    return type(cls.__name__, (cls,), {"__str__": error_str})
+
+
 def patch_errors(
     errors: T,
     path: Loc = (),
@@ -227,116 +274,97 @@ def patch_errors(
         The patched errors
     """
     if isinstance(errors, pydantic.ValidationError):
-        errors = to_legacy_error(errors, model).raw_errors
-        errors = patch_errors(errors, path, values, model, special_names, drop_names)
-        return ConfitValidationError(errors, model=model)
-    if isinstance(errors, list):
-        res = []
-        for error in errors:
-            res.extend(
-                patch_errors(error, path, values, model, special_names, drop_names)
-            )
-        return res
-    if isinstance(errors, ErrorWrapper) and isinstance(
-        errors.exc, LegacyValidationError
-    ):
-        try:
-            field_model = model
-            for part in errors.loc_tuple():
-                # if not issubclass(field_model, pydantic.BaseModel) and issubclass(
-                #     field_model.vd.model, pydantic.BaseModel
-                # ):
-                #     field_model = field_model.vd.model
-                if PYDANTIC_V1:
-                    field_model = field_model.__fields__[part]
-                else:
-                    field_model = field_model.model_fields[part]
-                if PYDANTIC_V1:
-                    field_model = field_model.type_
-                else:
-                    field_model = field_model.annotation
-            if (
-                field_model is errors.exc.model
-                or field_model.vd.model is errors.exc.model
-            ):
-                return patch_errors(
-                    errors.exc.raw_errors,
-                    (*path, *errors.loc_tuple()),
-                    values,
-                    model,
-                    special_names,
-                    drop_names,
+        raw_errors = to_legacy_error(errors, model).raw_errors
+        patched = patch_errors(
+            raw_errors, path, values, model, special_names, drop_names
+        )
+        return ConfitValidationError(patched, model=model)
+
+    res = []
+    # Depth-first work stack of (error(s), path prefix) entries: nested
+    # validation errors extend the stack instead of recursing, so patching
+    # uses a single frame however deep the config tree is
+    stack = [(errors, path)]
+    while stack:
+        error, prefix = stack.pop()
+        if isinstance(error, list):
+            stack.extend((e, prefix) for e in reversed(error))
+            continue
+        loc = error.loc_tuple()
+        if isinstance(error, ErrorWrapper) and isinstance(
+            error.exc, LegacyValidationError
+        ):
+            try:
+                field_model = model
+                for part in loc:
+                    # if not issubclass(field_model, pydantic.BaseModel) and
+                    # issubclass(field_model.vd.model, pydantic.BaseModel):
+                    #     field_model = field_model.vd.model
+                    field_model = _get_field_type(field_model, part)
+                if (
+                    field_model is error.exc.model
+                    or field_model.vd.model is error.exc.model
+                ):
+                    stack.append((error.exc.raw_errors, (*prefix, *loc)))
+                    continue
+            except (KeyError, AttributeError):  # pragma: no cover
+                print("Could not find model for", loc)
+
+        if (
+            isinstance(error.exc, PydanticErrorMixin)
+            and values is not None
+            and loc
+            and loc[0] in values
+        ):
+            if "actual_value" not in error.exc.__dict__:
+                actual_value = values
+                for key in loc:
+                    actual_value = actual_value[key]
+                vrepr = repr(actual_value)
+                error.exc.actual_value = (
+                    vrepr[:50] + "..." if len(vrepr) > 50 else vrepr
                 )
-        except (KeyError, AttributeError):  # pragma: no cover
-            print("Could not find model for", errors.loc_tuple())
-
-    if (
-        isinstance(errors.exc, PydanticErrorMixin)
-        and values is not None
-        and errors.loc_tuple()
-        and errors.loc_tuple()[0] in values
-    ):
-        if "actual_value" not in errors.exc.__dict__:
-            actual_value = values
-            for key in errors.loc_tuple():
-                actual_value = actual_value[key]
-            vrepr = repr(actual_value)
-            errors.exc.actual_value = vrepr[:50] + "..." if len(vrepr) > 50 else vrepr
-            errors.exc.actual_type = type(actual_value).__name__
-
-        cls = errors.exc.__class__
-        if cls not in PATCHED_ERRORS_CLS:
-
-            def error_str(self):
-                s = cls.__str__(self)
-                s = (
-                    s + f", got {self.actual_value} ({self.actual_type})"
-                    if hasattr(self, "actual_value")
-                    else s
+                error.exc.actual_type = type(actual_value).__name__
+
+            cls = error.exc.__class__
+            # The patched subclass is stored on the class itself (checked on
+            # its own __dict__ so subclasses are not shadowed by their parent)
+            new_cls = cls.__dict__.get("__confit_patched__")
+            if new_cls is None:
+                new_cls = _make_patched_error_cls(cls)
+                cls.__confit_patched__ = new_cls
+                new_cls.__confit_patched__ = new_cls
+            error.exc.__class__ = new_cls
+
+        if (
+            isinstance(error.exc, TypeError)
+            and str(error.exc).startswith("unexpected keyword argument")
+            and ":" in error.exc.args[0]
+        ):
+            extra_keys = error.exc.args[0].split(": ")[1].split(", ")
+            res.extend(
+                ErrorWrapper(
+                    TypeError("unexpected keyword argument"),
+                    (*prefix, *loc[:-1], key.strip("'")),
                 )
-                return s
-
-            new_cls = type(
-                cls.__name__,
-                (cls,),
-                {
-                    "msg_template": cls.msg_template
-                    + ", got {actual_value} ({actual_type})"
-                }
-                if hasattr(cls, "msg_template")
-                else {
-                    "__str__": error_str,
-                },
+                for key in extra_keys
             )
-            PATCHED_ERRORS_CLS[cls] = new_cls
-            PATCHED_ERRORS_CLS[new_cls] = new_cls
-        errors.exc.__class__ = PATCHED_ERRORS_CLS[cls]
-
-    if (
-        isinstance(errors.exc, TypeError)
-        and str(errors.exc).startswith("unexpected keyword argument")
-        and ":" in errors.exc.args[0]
-    ):
-        extra_keys = errors.exc.args[0].split(": ")[1].split(", ")
-        return [
-            ErrorWrapper(
-                TypeError("unexpected keyword argument"),
-                (*path, *errors.loc_tuple()[:-1], key.strip("'")),
-            )
-            for key in extra_keys
-        ]
-
-    loc_tuple = errors.loc_tuple()
-    if loc_tuple and loc_tuple[-1] in special_names:
-        loc_tuple = (*loc_tuple[:-1], "[signature]")
-    loc_tuple = tuple(part for part in loc_tuple if part not in drop_names)
-
-    return [
-        ErrorWrapper(
-            errors.exc,
-            (*path, *loc_tuple),
-        )
-    ]
+            continue
+
+        # No name rewriting requested (the common case): keep the location
+        # as-is instead of regenerating the tuple
+        if not special_names and not drop_names:
+            res.append(ErrorWrapper(error.exc, (*prefix, *loc)))
+            continue
+
+        loc_tuple = loc
+        if loc_tuple and loc_tuple[-1] in special_names:
+            loc_tuple = (*loc_tuple[:-1], "[signature]")
+        loc_tuple = tuple(part for part in loc_tuple if part not in drop_names)
+
+        res.append(ErrorWrapper(error.exc, (*prefix, *loc_tuple)))
+
+    return res
 
 
 def flatten_errors(
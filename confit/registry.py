@@ -34,6 +34,24 @@ except ImportError:
 PYDANTIC_V1 = pydantic.VERSION.split(".")[0] == "1"
 Func = TypeVar("Func")
 
+_VALIDATED_FN_CACHE: Dict[Any, ValidatedFunction] = {}
+
+
+def _get_validated_function(fn: Callable, config: Dict) -> ValidatedFunction:
+    """
+    Build a `ValidatedFunction` (which synthesizes a pydantic model) for a
+    function and validation config, reusing a previously built one when the
+    same function is decorated again.
+    """
+    try:
+        key = (fn, tuple(sorted(config.items())))
+        vd = _VALIDATED_FN_CACHE.get(key)
+        if vd is None:
+            vd = _VALIDATED_FN_CACHE[key] = ValidatedFunction(fn, config)
+        return vd
+    except TypeError:  # unhashable function or config value
+        return ValidatedFunction(fn, config)
+
 
 def _resolve_and_validate_call(
     args: Sequence[Any],
@@ -42,10 +60,17 @@ def _resolve_and_validate_call(
     use_self: bool,
     callee: Callable,
     invoker: Optional[Callable[[Callable, Dict[str, Any]], Any]],
+    model_fields: Optional[Dict[str, Any]] = None,
 ) -> Any:
     returned = None
     resolved = None
     extras_name = pydantic_func.v_kwargs_name
+    if model_fields is None:
+        model_fields = (
+            pydantic_func.model.__fields__
+            if PYDANTIC_V1
+            else pydantic_func.model.model_fields
+        )
 
     # Call the pydantic model with the values
     # If an invoker was provided, use it to invoke the function
@@ -56,12 +81,7 @@ def _resolve_and_validate_call(
         # "self" must be passed as a positional argument
         if use_self:
             kw = {**kw, self_name: resolved}
-        fields = (
-            pydantic_func.model.__fields__
-            if PYDANTIC_V1
-            else pydantic_func.model.model_fields
-        )
-        extras = [key for key in kw if key not in fields and key != extras_name]
+        extras = [key for key in kw if key not in model_fields and key != extras_name]
         try:
             model_instance = pydantic_func.model(
                 **{
@@ -180,6 +200,9 @@ def validate_arguments(
     def validate(_func: Callable) -> Callable:
         if isinstance(_func, type):
             _func: type
+            # Don't share the ValidatedFunction here: classes may inherit the
+            # same __init__, and the model is mutated (renamed, defaults) for
+            # each registered class below
             if hasattr(_func.__init__, "__wrapped__"):
                 vd = ValidatedFunction(_func.__init__.__wrapped__, config)
             else:
@@ -189,6 +212,7 @@ def validate_arguments(
                 vd.model.__fields__["self"].default = None
             else:
                 vd.model.model_fields["self"].default = None
+            vd_fields = vd.model.__fields__ if PYDANTIC_V1 else vd.model.model_fields
 
             # This function is called by Pydantic when asked to cast
             # a value (most likely a dict) as a Model (most often during
@@ -285,6 +309,7 @@ def validate_arguments(
                         use_self=True,
                         invoker=invoker,
                         callee=_func,
+                        model_fields=vd_fields,
                     )
                 except Exception as e:
                     if not is_debug() and isinstance(
@@ -306,7 +331,8 @@ def validate_arguments(
             return _func
 
         else:
-            vd = ValidatedFunction(_func, config)
+            vd = _get_validated_function(_func, config)
+            vd_fields = vd.model.__fields__ if PYDANTIC_V1 else vd.model.model_fields
 
             @wraps(
                 _func,
@@ -330,6 +356,7 @@ def validate_arguments(
                         use_self=False,
                         invoker=invoker,
                         callee=_func,
+                        model_fields=vd_fields,
                     )
                 except Exception as e:
                     if not is_debug() and isinstance(
@@ -1,10 +1,11 @@
-import collections
 import re
+from functools import lru_cache
 from typing import Any, Dict, Tuple, TypeVar, Union
 
 T = TypeVar("T")
 
 KEY_PART = r"(?:'([^']*)'|\"([^\"]*)\"|([^.]*))(?:[.]|$)"
+KEY_PART_RE = re.compile(KEY_PART)
 
 
 def join_path(path):
@@ -19,16 +20,31 @@ def join_path(path):
     -------
     str
     """
+    # Fast path: simple string parts join as-is without any quoting
+    if all(
+        type(x) is str
+        and x
+        and not x.isdigit()
+        and "." not in x
+        and "'" not in x
+        and '"' not in x
+        and x == x.strip()
+        for x in path
+    ):
+        return ".".join(path)
     return ".".join(
         repr(x) if not isinstance(x, str) or split_path(x.strip()) != (x,) else x
         for x in path
     )
 
 
+@lru_cache(maxsize=4096)
 def split_path(path: str) -> Tuple[Union[int, str]]:
     """
     Split a path around "." into a tuple of strings and ints.
     If a sub-path is quoted, it will be returned as a full non-split string.
+    The same section keys come up over and over when parsing and merging
+    configs, so the result is memoized.
 
     Parameters
     ----------
@@ -38,9 +54,13 @@ def split_path(path: str) -> Tuple[Union[int, str]]:
     -------
 
     """
+    path = str(path)
+    # Fast path: no quoted sub-path, a plain split is enough
+    if "'" not in path and '"' not in path:
+        return tuple(int(p) if p.isdigit() else p for p in path.split("."))
     offset = 0
     result = []
-    for match in re.finditer(KEY_PART, str(path)):
+    for match in KEY_PART_RE.finditer(path):
         assert match.start() == offset, f"Malformed path: {path!r} in config"
         offset = match.end()
         part = next((g for g in match.groups() if g is not None))
@@ -63,20 +83,21 @@ def flatten_sections(root: Dict[str, Any]) -> Dict[str, Any]:
     -------
     Dict[str, Dict[str, Any]]
     """
-    res = collections.defaultdict(lambda: {})
-
-    def rec(d, path):
-        res.setdefault(join_path(path), {})
-        section = {}
+    res = {}
+    # Iterative depth-first walk, keeping the pre-order section layout
+    # of the recursive version
+    stack = [(root, ())]
+    while stack:
+        d, path = stack.pop()
+        section = res.setdefault(join_path(path), {})
+        children = []
         for k, v in d.items():
             if isinstance(v, dict):
-                rec(v, (*path, k))
+                children.append((v, (*path, k)))
             else:
                 section[k] = v
-        res[join_path(path)].update(section)
-
-    rec(root, ())
+        stack.extend(reversed(children))
     root_level = res.pop("", None)
     if root_level is not None and len(root_level) > 0:
         raise Exception("Cannot dump root level config", root_level)
-    return dict(res)
+    return res
@@ -1,4 +1,5 @@
 import ast
+import re
 from typing import Any, Callable
 
 from lark import Lark, Transformer, Tree
@@ -17,6 +18,8 @@ class Reference:
             The path to the value in the configuration.
         """
         self.value = value
+        # References are immutable once built, so hash once
+        self._hash = hash((Reference, value))
 
     def __repr__(self):
         return f"${{{self.value}}}"
@@ -25,7 +28,12 @@ class Reference:
         return self.__repr__()
 
     def __eq__(self, other):
-        return self.value == other.value
+        if self is other:
+            return True
+        return isinstance(other, Reference) and self.value == other.value
+
+    def __hash__(self):
+        return self._hash
 
 
 # Extended JSON grammar to parse references and tuples
@@ -259,6 +267,23 @@ class MalformedValueError(ValueError):
         super().__init__(f"Malformed value: {value!r}")
 
 
+# Fast paths for the most common scalar values, to avoid running the
+# full grammar-based parser on trivial inputs
+_FAST_LITERALS = {
+    "true": True,
+    "True": True,
+    "false": False,
+    "False": False,
+    "null": None,
+    "None": None,
+}
+_INT_RE = re.compile(r"[+-]?[0-9]+")
+
+# Characters that can introduce a non-trivial xjson construct (string,
+# container, reference or comment)
+_SPECIAL_CHARS = frozenset(",'\"{}[]$()#")
+
+
 def loads(s: str):
     """
     Load an extended JSON string into a python object.
@@ -272,6 +297,17 @@ def loads(s: str):
     -------
     Any
     """
+    if s in _FAST_LITERALS:
+        return _FAST_LITERALS[s]
+    if _INT_RE.fullmatch(s):
+        return int(s)
+    if not (_SPECIAL_CHARS & set(s)):
+        # No construct marker: only numbers (incl. Infinity/NaN) can still
+        # parse to something other than the raw string
+        try:
+            float(s)
+        except ValueError:
+            return s
     try:
         return XJsonTransformer(s).transform(_json_parser.parse(s))
     except Exception:
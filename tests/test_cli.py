@@ -212,6 +212,23 @@ def test_fail_override(change_test_dir):
     assert "does not match any existing section in config" in str(result.exception)
 
 
+trusted_app = Cli(pretty_exceptions_show_locals=False)
+
+
+@trusted_app.command(name="script", trusted=True)
+def trusted_app_function(value: int):
+    # no validation -> the raw (string) override is passed through
+    print("VALUE:", repr(value))
+
+
+def test_cli_trusted(change_test_dir):
+    # "'4'" parses to the string "4": validation would coerce it to the int
+    # annotation, so seeing the raw string proves the bypass is effective
+    result = runner.invoke(trusted_app, ["--value", "'4'"])
+    assert result.exit_code == 0, result.stdout
+    assert "VALUE: '4'" in result.stdout
+
+
 seed_app = Cli(pretty_exceptions_show_locals=False)
 
 
@@ -752,3 +752,49 @@ test:
 """
     ).resolve(registry=registry)
     assert config["test"]["b"] is None
+
+
+def test_resolve_bypass_validators():
+    @registry.factory.register("raw-dict")
+    def raw_dict(value: int):
+        return {"value": value}
+
+    config = Config.from_str(
+        """\
+[model]
+@factory = "raw-dict"
+value = "3"
+"""
+    )
+    resolved = config.resolve(registry=registry, bypass_validators=True)
+    # the raw function is called directly, so the string is not coerced
+    assert resolved["model"]["value"] == "3"
+    resolved = config.resolve(registry=registry)
+    assert resolved["model"]["value"] == 3
+
+
+def test_serialize_is_silent(capsys):
+    config = Config({"section": {"a": 1, "nested": {"b": [2, 3]}}})
+    Config.serialize(config)
+    assert capsys.readouterr().out == ""
+
+
+def test_default_section_does_not_leak():
+    config = Config.from_str(
+        """\
+[DEFAULT]
+shared = 1
+
+[a]
+x = 2
+"""
+    )
+    assert config == {"a": {"shared": 1, "x": 2}}
+    # The reused parser must not carry [DEFAULT] keys over to the next parse
+    config = Config.from_str(
+        """\
+[b]
+y = 3
+"""
+    )
+    assert config == {"b": {"y": 3}}